@@ -1,20 +1,145 @@
-from fastapi import FastAPI, Request, HTTPException, Depends, Header
+from fastapi import FastAPI, Request, HTTPException, Depends, Header, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-import requests
+import httpx
 from dotenv import load_dotenv
 from datetime import datetime
 import os
-import json
-from fastapi.responses import JSONResponse
+import orjson
+import asyncio
+import logging
+import functools
+import contextlib
+import weakref
+from cachetools import TTLCache
+from fastapi.responses import ORJSONResponse
 
 # Load environment variables
 load_dotenv()
 
+# Configure logging once; set LOG_LEVEL=DEBUG to include raw webhook payloads
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+logger = logging.getLogger(__name__)
+
 # Get environment variables
 MONDAY_API_URL = "https://api.monday.com/v2"
 MONDAY_API_KEY = os.getenv("MONDAY_API_KEY")
 
-app = FastAPI(title="Monday.com Date Automation")
+app = FastAPI(title="Monday.com Date Automation", default_response_class=ORJSONResponse)
+
+# Column IDs on the Monday.com boards
+PARENT_DATE_COLUMN_ID = "date7"  # Creative Deadline column in parent items
+SUBITEM_DATE_COLUMN_ID = "date_mkn2am1b"  # Date column in subitems
+
+# GraphQL documents used against the Monday.com API
+
+# Parent item's Creative Deadline and its subitems
+PARENT_WITH_SUBITEMS_QUERY = """
+query GetParentWithSubitems($itemId: ID!) {
+  items(ids: [$itemId]) {
+    name
+    column_values(ids: ["%s"]) {
+      value
+      text
+    }
+    subitems {
+      id
+      name
+      board { id }
+    }
+  }
+}
+""" % PARENT_DATE_COLUMN_ID
+
+# Parent item's Creative Deadline only
+PARENT_ITEM_QUERY = """
+query GetParentItem($itemId: ID!) {
+  items(ids: [$itemId]) {
+    id
+    name
+    column_values(ids: ["%s"]) {
+      id
+      value
+    }
+  }
+}
+""" % PARENT_DATE_COLUMN_ID
+
+# Set a single column value on an item
+CHANGE_COLUMN_VALUE_MUTATION = """
+mutation UpdateSubitemDate($boardId: ID!, $itemId: ID!, $columnId: String!, $value: JSON!) {
+  change_column_value(board_id: $boardId, item_id: $itemId, column_id: $columnId, value: $value) {
+    id
+  }
+}
+"""
+
+# Statuses worth retrying: rate limiting and transient gateway errors
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+MAX_ATTEMPTS = 3
+# Extra connection attempts the transport makes within each request attempt
+CONNECT_RETRIES = 1
+RETRY_BACKOFF_SECONDS = 0.2
+
+def create_http_client():
+    """Create the async HTTP client used for all Monday.com API calls"""
+    # The transport retries failed connection attempts; status-based
+    # retries are handled in execute_monday_query
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=CONNECT_RETRIES,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    )
+    return httpx.AsyncClient(
+        headers={
+            "Authorization": MONDAY_API_KEY or "",
+            "Content-Type": "application/json"
+        },
+        transport=transport,
+        timeout=httpx.Timeout(10.0, connect=3.05),
+    )
+
+# Shared async HTTP client so Monday.com calls don't block the event loop
+# and keep-alive connections are reused across webhook deliveries. Pooled
+# connections belong to the loop that opened them, so the loop is recorded too.
+HTTP = None
+HTTP_LOOP = None
+
+def get_http_client():
+    """
+    Return the shared HTTP client for the running event loop
+
+    The client is (re)created when it doesn't exist yet, has been closed, or
+    was created on a different loop. Serverless runtimes may run each
+    invocation on a new loop and don't always deliver startup events, so
+    callers go through here instead of relying on the startup hook alone.
+    """
+    global HTTP, HTTP_LOOP
+    loop = asyncio.get_running_loop()
+    if HTTP is None or HTTP.is_closed or HTTP_LOOP is not loop:
+        HTTP = create_http_client()
+        HTTP_LOOP = loop
+    return HTTP
+
+# asyncio semaphores bind to the first event loop that waits on them, so
+# each loop gets its own (see get_http_client for why loops can change)
+LOOP_SEMAPHORES = weakref.WeakKeyDictionary()
+
+def get_loop_semaphore(name, limit):
+    """Return the running loop's semaphore for `name`, creating it on first use"""
+    semaphores = LOOP_SEMAPHORES.setdefault(asyncio.get_running_loop(), {})
+    if name not in semaphores:
+        semaphores[name] = asyncio.Semaphore(limit)
+    return semaphores[name]
+
+# Cap concurrent Monday.com requests so fan-out doesn't trip rate limits
+MONDAY_CONCURRENCY_LIMIT = 10
+
+def monday_concurrency():
+    """Semaphore limiting concurrent Monday.com requests on the running loop"""
+    return get_loop_semaphore("monday", MONDAY_CONCURRENCY_LIMIT)
 
 # Add CORS middleware
 app.add_middleware(
@@ -25,6 +150,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+async def startup_http_client():
+    """Create the shared HTTP client on the server's event loop"""
+    get_http_client()
+
+@app.on_event("shutdown")
+async def shutdown_http_client():
+    """Close the shared HTTP client and its pooled connections"""
+    if HTTP is not None and HTTP_LOOP is asyncio.get_running_loop():
+        await HTTP.aclose()
+
 # Add a test endpoint for debugging Vercel deployment
 @app.get("/test")
 async def test_endpoint():
@@ -61,132 +197,223 @@ async def root():
         "status": "running"
     }
 
-async def execute_monday_query(query, variables=None):
-    """Execute a query against the Monday.com API"""
+async def execute_monday_query(query, variables=None, allow_partial=False, limited=False):
+    """
+    Execute a query against the Monday.com API
+
+    With allow_partial, a response that has both errors and data is returned
+    instead of raising, so callers can check which aliased fields succeeded.
+    With limited, each attempt holds the concurrency semaphore, which is
+    released again while backing off between retries.
+    """
     if not MONDAY_API_KEY:
         raise HTTPException(status_code=500, detail="Monday.com API key not configured")
     
-    headers = {
-        "Authorization": MONDAY_API_KEY,
-        "Content-Type": "application/json"
-    }
-    
     data = {
         "query": query,
         "variables": variables
     }
     
-    print(f"Sending request to Monday.com API with variables: {json.dumps(variables, indent=2)}")
+    logger.debug("Sending request to Monday.com API with variables: %s", variables)
+    
+    payload = orjson.dumps(data)
     
     try:
-        response = requests.post(MONDAY_API_URL, json=data, headers=headers)
-        
-        # Print the response status and content for debugging
-        print(f"Monday.com API response status: {response.status_code}")
+        for attempt in range(MAX_ATTEMPTS):
+            async with monday_concurrency() if limited else contextlib.nullcontext():
+                response = await get_http_client().post(MONDAY_API_URL, content=payload)
+            
+            # Log the response status for debugging
+            logger.debug("Monday.com API response status: %s", response.status_code)
+            
+            if response.status_code not in RETRYABLE_STATUS_CODES or attempt == MAX_ATTEMPTS - 1:
+                break
+            
+            delay = RETRY_BACKOFF_SECONDS * 2 ** attempt
+            logger.warning("Monday.com API returned %s, retrying in %.1fs", response.status_code, delay)
+            await asyncio.sleep(delay)
         
         if response.status_code != 200:
             error_detail = f"Error from Monday.com API: {response.text}"
-            print(error_detail)
+            logger.error(error_detail)
             raise HTTPException(status_code=response.status_code, detail=error_detail)
         
-        response_json = response.json()
+        response_json = orjson.loads(response.content)
         
         # Check for errors in the response
         if "errors" in response_json:
             error_messages = [error.get("message", "Unknown error") for error in response_json.get("errors", [])]
             error_detail = f"Monday.com API returned errors: {', '.join(error_messages)}"
-            print(error_detail)
-            raise HTTPException(status_code=400, detail=error_detail)
+            logger.error(error_detail)
+            if not (allow_partial and response_json.get("data")):
+                raise HTTPException(status_code=400, detail=error_detail)
         
         return response_json
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         error_detail = f"Request to Monday.com API failed: {str(e)}"
-        print(error_detail)
+        logger.error(error_detail)
         raise HTTPException(status_code=500, detail=error_detail)
 
-
+async def execute_monday_query_limited(query, variables=None, allow_partial=False):
+    """Execute a Monday.com query under the concurrency semaphore"""
+    return await execute_monday_query(query, variables, allow_partial, limited=True)
 
 @app.post("/")
-async def root_webhook(request: Request):
+async def root_webhook(request: Request, background: BackgroundTasks):
     """
     Root webhook endpoint for Monday.com
     
     This endpoint handles the same functionality as /webhook but at the root path
     """
-    print("Received request at root endpoint")
-    return await monday_webhook(request)
+    logger.debug("Received request at root endpoint")
+    return await monday_webhook(request, background)
+
+# Cap how many webhook events are processed at once so bursts of
+# deliveries queue up instead of exhausting the worker
+WEBHOOK_CONCURRENCY_LIMIT = 20
+
+def webhook_concurrency():
+    """Semaphore limiting concurrent webhook event processing on the running loop"""
+    return get_loop_semaphore("webhook", WEBHOOK_CONCURRENCY_LIMIT)
+
+async def handle_item_event(body):
+    """Route an item creation/update to the subitem or parent sync"""
+    # Check if this is a subitem creation (has parentItemId)
+    if body["event"].get("parentItemId"):
+        logger.info("This is a subitem creation, syncing with parent")
+        await sync_subitem_with_parent(body)
+    else:
+        # Regular item creation/update
+        await process_date_automation(body)
+
+# Webhook event type -> coroutine that processes it
+WEBHOOK_EVENT_HANDLERS = {
+    "create_pulse": handle_item_event,
+    "update_column_value": handle_item_event,
+}
+
+async def handle_webhook_event(body):
+    """
+    Process a webhook event after the response has been sent
+
+    Errors are logged here since there is no longer a caller to report them to.
+    """
+    event = body.get("event") if isinstance(body, dict) else None
+    event_type = event.get("type") if isinstance(event, dict) else None
+    
+    handler = WEBHOOK_EVENT_HANDLERS.get(event_type)
+    if not handler:
+        logger.debug("Unhandled event type: %s", event_type)
+        return
+    
+    async with webhook_concurrency():
+        try:
+            logger.info("Processing event: %s", event_type)
+            await handler(body)
+        except Exception:
+            logger.exception("Error processing %s event", event_type)
+
+async def handle_webhook_events(events):
+    """Process every event from one webhook delivery concurrently"""
+    await asyncio.gather(*(handle_webhook_event(body) for body in events))
 
 @app.post("/webhook")
-async def monday_webhook(request: Request):
+async def monday_webhook(request: Request, background: BackgroundTasks):
     """
     Webhook endpoint for Monday.com
     
     This endpoint handles:
     1. Challenge response for webhook setup
     2. Processing webhook events for date automation
+    
+    Events are acknowledged immediately and processed in the background,
+    so Monday.com doesn't time out and retry while API calls are in flight.
     """
-    # Parse the webhook payload
+    # Parse the webhook payload straight from the raw bytes
+    raw_body = await request.body()
+    logger.debug("raw=%r", raw_body)
+    
     try:
-        # Get the raw body first for debugging
-        raw_body = await request.body()
-        print(f"Raw webhook body: {raw_body}")
-        
-        # Try to parse as JSON
-        try:
-            body = await request.json()
-        except Exception as json_error:
-            print(f"Error parsing JSON: {str(json_error)}")
-            # Try to decode the raw body as a fallback
-            try:
-                body_str = raw_body.decode('utf-8')
-                body = json.loads(body_str)
-            except Exception as decode_error:
-                print(f"Error decoding body: {str(decode_error)}")
-                raise HTTPException(status_code=400, detail=f"Invalid JSON payload: {str(json_error)}")
-        
-        # Log only essential webhook info
-        event = body.get("event", {})
-        event_type = event.get("type")
-        
-        print(f"Webhook body: {json.dumps(body, indent=2)}")
-        
-        # Handle challenge during webhook setup
-        if "challenge" in body:
-            print("Received challenge request")
-            return body
-        
-        print(f"Event type: {event_type}")
-        
-        # Handle different event types
-        if event_type == "create_pulse" or event_type == "update_column_value":
-            print(f"Processing event: {event_type}")
-            
-            # Check if this is a subitem creation (has parentItemId)
-            if body.get("event", {}).get("parentItemId"):
-                print("This is a subitem creation, syncing with parent")
-                await sync_subitem_with_parent(body)
-            else:
-                # Regular item creation/update
-                await process_date_automation(body)
-        elif "subitem" in str(event_type).lower():
-            print(f"Detected subitem event: {event_type}")
-        else:
-            print(f"Unhandled event type: {event_type}")
-            
-        return {"status": "success"}
-    except Exception as e:
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"Error in webhook handler: {str(e)}")
-        print(f"Traceback: {error_trace}")
-        
-        # Return a more detailed error response
-        return {
-            "status": "error",
-            "error": str(e),
-            "traceback": error_trace,
-            "timestamp": datetime.now().isoformat()
-        }
+        body = orjson.loads(raw_body) if raw_body else {}
+    except orjson.JSONDecodeError as json_error:
+        logger.error("Error parsing JSON: %s", json_error)
+        raise HTTPException(status_code=400, detail="invalid JSON")
+    
+    logger.debug("Webhook body: %s", body)
+    
+    # Handle challenge during webhook setup
+    if isinstance(body, dict) and "challenge" in body:
+        logger.info("Received challenge request")
+        return body
+    
+    # Batched deliveries arrive as a JSON array of webhook bodies
+    events = body if isinstance(body, list) else [body]
+    logger.debug("Received %d webhook event(s)", len(events))
+    
+    # Processing errors are logged by handle_webhook_event
+    background.add_task(handle_webhook_events, events)
+    return {"status": "accepted", "events": len(events)}
+
+# Subitem updates sent per aliased GraphQL request, kept small to stay
+# under Monday.com's per-query complexity budget
+MUTATION_BATCH_SIZE = 25
+
+# Latest date written to each (item ID, column ID) in the last 30 seconds.
+# Monday.com echoes each write back as another webhook, so this drops the
+# repeat mutations (and the feedback loop) during a burst.
+RECENT_DATE_WRITES = TTLCache(maxsize=10000, ttl=30)
+
+def written_date(date_value):
+    """Reduce a date column value to its date and time, ignoring extra fields"""
+    try:
+        parsed = orjson.loads(date_value)
+        return (parsed.get("date"), parsed.get("time") or None)
+    except (orjson.JSONDecodeError, AttributeError, TypeError):
+        return date_value
+
+def record_date_write(item_id, column_id, date_value):
+    """
+    Record a date write, returning False if the same value was just written
+
+    Each write replaces the previous entry for the item's column, so a
+    change back to an earlier date is still sent.
+    """
+    key = (str(item_id), column_id)
+    written = written_date(date_value)
+    if RECENT_DATE_WRITES.get(key) == written:
+        return False
+    RECENT_DATE_WRITES[key] = written
+    return True
+
+def forget_date_write(item_id, column_id, date_value):
+    """Drop a failed write so a later webhook can retry it, unless it was superseded"""
+    key = (str(item_id), column_id)
+    if RECENT_DATE_WRITES.get(key) == written_date(date_value):
+        RECENT_DATE_WRITES.pop(key, None)
+
+@functools.lru_cache(maxsize=MUTATION_BATCH_SIZE)
+def build_batched_date_mutation(count):
+    """
+    Build one GraphQL mutation that updates `count` items via aliases s0..sN
+
+    Every alias writes the same $columnId/$value, so only the board and item
+    IDs are passed per alias. Results are cached since only the batch size
+    varies.
+    """
+    arguments = ", ".join(f"$b{i}: ID!, $i{i}: ID!" for i in range(count))
+    fields = " ".join(
+        f"s{i}: change_column_value(board_id: $b{i}, item_id: $i{i}, "
+        f"column_id: $columnId, value: $value) {{ id }}"
+        for i in range(count)
+    )
+    return f"mutation({arguments}, $columnId: String!, $value: JSON!) {{ {fields} }}"
+
+def event_clears_date(event):
+    """Check whether a webhook event reports the Creative Deadline being cleared"""
+    if event.get("columnId") != PARENT_DATE_COLUMN_ID or "value" not in event:
+        return False
+    new_value = event.get("value")
+    return not (isinstance(new_value, dict) and new_value.get("date"))
 
 async def process_date_automation(webhook_data):
     """
@@ -197,36 +424,24 @@ async def process_date_automation(webhook_data):
     item_id = event.get("pulseId") or event.get("pulse_id") or event.get("itemId")
     
     if not item_id:
-        print("📋 Missing item ID in webhook data")
+        logger.warning("📋 Missing item ID in webhook data")
         return
     
-    print(f"🔄 Processing sync for item ID: {item_id}")
+    logger.info("🔄 Processing sync for item ID: %s", item_id)
     
-    # Get parent item with date column and subitems
-    query = """
-    query {
-      items(ids: [%s]) {
-        name
-        column_values(ids: ["date7"]) {
-          value
-          text
-        }
-        subitems {
-          id
-          name
-          board { id }
-        }
-      }
-    }
-    """ % item_id
+    # When the Creative Deadline itself was cleared, the webhook already
+    # says so and there is nothing to sync
+    if event_clears_date(event):
+        logger.info("⏩ No date value to sync")
+        return
     
     try:
         # Get parent item data
-        result = await execute_monday_query(query)
+        result = await execute_monday_query(PARENT_WITH_SUBITEMS_QUERY, {"itemId": str(item_id)})
         items = result.get("data", {}).get("items", [])
         
         if not items:
-            print(f"❌ Parent item {item_id} not found")
+            logger.warning("❌ Parent item %s not found", item_id)
             return
         
         parent = items[0]
@@ -234,60 +449,74 @@ async def process_date_automation(webhook_data):
         date_column = parent.get("column_values", [])[0] if parent.get("column_values") else None
         
         if not date_column:
-            print("❌ Creative Deadline column not found")
+            logger.warning("❌ Creative Deadline column not found")
             return
         
-        # Get date value
+        # Get date value from the item just fetched, which is current even if
+        # webhooks are processed out of order
         date_value = date_column.get("value")
         date_text = date_column.get("text", "")
         
-        print(f"📅 Parent '{parent_name}' date: {date_text}")
+        logger.info("📅 Parent '%s' date: %s", parent_name, date_text)
         
         # Skip if no date value
         if not date_value or date_value == "null":
-            print("⏩ No date value to sync")
+            logger.info("⏩ No date value to sync")
             return
         
         # Get subitems
         subitems = parent.get("subitems", [])
         if not subitems:
-            print("ℹ️ No subitems found")
+            logger.info("ℹ️ No subitems found")
             return
         
-        print(f"📋 Found {len(subitems)} subitems to update")
+        logger.info("📋 Found %d subitems to update", len(subitems))
         
-        # Update all subitems
-        mutation = """
-        mutation($boardId: ID!, $itemId: ID!, $columnId: String!, $value: JSON!) {
-            change_column_value(board_id: $boardId, item_id: $itemId, column_id: $columnId, value: $value) {
-                id
-            }
-        }
-        """
+        valid_subitems = [
+            subitem for subitem in subitems
+            if subitem.get("id") and subitem.get("board", {}).get("id")
+        ]
         
-        for subitem in subitems:
-            subitem_id = subitem.get("id")
-            subitem_name = subitem.get("name", "Unknown")
-            subitem_board_id = subitem.get("board", {}).get("id")
-            
-            if not subitem_id or not subitem_board_id:
+        # Skip subitems that were just given this same date
+        pending_subitems = []
+        for subitem in valid_subitems:
+            if not record_date_write(subitem["id"], SUBITEM_DATE_COLUMN_ID, date_value):
+                logger.debug("Skipping duplicate write for %s", subitem.get("name", "Unknown"))
                 continue
-            
-            variables = {
-                "boardId": subitem_board_id,
-                "itemId": subitem_id,
-                "columnId": "date_mkn2am1b",
-                "value": date_value
-            }
-            
-            try:
-                await execute_monday_query(mutation, variables)
-                print(f"✅ Updated: {subitem_name}")
-            except Exception as e:
-                print(f"❌ Error updating {subitem_name}: {str(e)}")
+            pending_subitems.append(subitem)
+        valid_subitems = pending_subitems
+        
+        # Update all subitems, one aliased mutation per batch
+        batches = [
+            valid_subitems[start:start + MUTATION_BATCH_SIZE]
+            for start in range(0, len(valid_subitems), MUTATION_BATCH_SIZE)
+        ]
+        tasks = []
+        for batch in batches:
+            variables = {"columnId": SUBITEM_DATE_COLUMN_ID, "value": date_value}
+            for i, subitem in enumerate(batch):
+                variables[f"b{i}"] = subitem["board"]["id"]
+                variables[f"i{i}"] = subitem["id"]
+            tasks.append(execute_monday_query_limited(
+                build_batched_date_mutation(len(batch)), variables, allow_partial=True
+            ))
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        for batch, result in zip(batches, results):
+            # Each alias s{i} is null when that subitem's write failed
+            data = {} if isinstance(result, Exception) else result.get("data") or {}
+            for i, subitem in enumerate(batch):
+                subitem_name = subitem.get("name", "Unknown")
+                if data.get(f"s{i}"):
+                    logger.info("✅ Updated: %s", subitem_name)
+                else:
+                    # Allow the write to be retried by a later webhook
+                    forget_date_write(subitem["id"], SUBITEM_DATE_COLUMN_ID, date_value)
+                    error = result if isinstance(result, Exception) else "no result returned"
+                    logger.error("❌ Error updating %s: %s", subitem_name, error)
                 
     except Exception as e:
-        print(f"❌ Error: {str(e)}")
+        logger.error("❌ Error: %s", e)
 
 async def sync_subitem_with_parent(webhook_data):
     """
@@ -305,107 +534,37 @@ async def sync_subitem_with_parent(webhook_data):
     parent_item_id = event.get("parentItemId")
     parent_board_id = event.get("parentItemBoardId")
     
-    print(f"Syncing subitem {subitem_id} on board {subitem_board_id} with parent {parent_item_id} on board {parent_board_id}")
+    logger.info("Syncing subitem %s on board %s with parent %s on board %s",
+                subitem_id, subitem_board_id, parent_item_id, parent_board_id)
     
     if not all([subitem_id, subitem_board_id, parent_item_id, parent_board_id]):
-        print("Missing required IDs for subitem-parent sync")
+        logger.warning("Missing required IDs for subitem-parent sync")
         return
     
-    # 1. Get the parent item to find its Creative Deadline column
-    parent_query = """
-    query GetParentItem($itemId: ID!) {
-      items(ids: [$itemId]) {
-        id
-        name
-        column_values {
-          id
-          type
-          value
-        }
-      }
-    }
-    """
-    
+    # 1. Get the parent item's Creative Deadline column
     parent_variables = {
         "itemId": parent_item_id
     }
     
-    parent_result = await execute_monday_query(parent_query, parent_variables)
-    
-    # 2. Get the subitem to find its Date column
-    subitem_query = """
-    query GetSubItem($itemId: ID!) {
-      items(ids: [$itemId]) {
-        id
-        name
-        column_values {
-          id
-          type
-          value
-        }
-      }
-    }
-    """
-    
-    subitem_variables = {
-        "itemId": subitem_id
-    }
-    
-    subitem_result = await execute_monday_query(subitem_query, subitem_variables)
+    parent_result = await execute_monday_query(PARENT_ITEM_QUERY, parent_variables)
     
     try:
         # Extract parent item data
         parent_items = parent_result.get("data", {}).get("items", [])
         if not parent_items:
-            print(f"Parent item {parent_item_id} not found")
+            logger.warning("Parent item %s not found", parent_item_id)
             return
             
         parent_item = parent_items[0]
         parent_name = parent_item.get("name", "Unknown")
-        print(f"Found parent item: {parent_name}")
+        logger.debug("Found parent item: %s", parent_name)
         
-        # Find the Creative Deadline column in parent
-        # Using the known column ID for Creative Deadline
-        PARENT_DATE_COLUMN_ID = "date7"  # ID of the Creative Deadline column in parent items
-        parent_date_col = next((col for col in parent_item.get("column_values", []) 
-                              if col.get("id") == PARENT_DATE_COLUMN_ID), None)
-        
-        # If not found by ID, try any date column
-        if not parent_date_col:
-            parent_date_col = next((col for col in parent_item.get("column_values", []) 
-                                  if col.get("type") == "date"), None)
+        # The query only requests the Creative Deadline column
+        parent_date_col = parent_item.get("column_values", [])[0] if parent_item.get("column_values") else None
         
         if not parent_date_col:
-            print(f"No date column found in parent item {parent_item_id}")
+            logger.warning("Creative Deadline column not found in parent item %s", parent_item_id)
             return
-            
-        print(f"Found parent date column: ID={parent_date_col.get('id')}")
-        
-        # Extract subitem data
-        subitem_items = subitem_result.get("data", {}).get("items", [])
-        if not subitem_items:
-            print(f"Subitem {subitem_id} not found")
-            return
-            
-        subitem = subitem_items[0]
-        subitem_name = subitem.get("name", "Unknown")
-        print(f"Found subitem: {subitem_name}")
-        
-        # Find the Date column in subitem using the ID you provided
-        SUBITEM_DATE_COLUMN_ID = "date_mkn2am1b"  # ID of the Date column in subitems
-        subitem_date_col = next((col for col in subitem.get("column_values", []) 
-                                if col.get("id") == SUBITEM_DATE_COLUMN_ID), None)
-        
-        # If not found by ID, try any date column
-        if not subitem_date_col:
-            subitem_date_col = next((col for col in subitem.get("column_values", []) 
-                                   if col.get("type") == "date"), None)
-        
-        if not subitem_date_col:
-            print(f"No date column found in subitem {subitem_id}")
-            return
-        
-        print(f"Found subitem date column: ID={subitem_date_col.get('id')}")
         
         # Get the parent date value
         parent_value = parent_date_col.get("value")
@@ -413,59 +572,53 @@ async def sync_subitem_with_parent(webhook_data):
         # Try to parse and display the date in a readable format
         try:
             if parent_value and parent_value != "null":
-                date_json = json.loads(parent_value)
+                date_json = orjson.loads(parent_value)
                 date_str = date_json.get("date", "No date found")
-                print(f"Parent date value: {date_str}")
+                logger.info("Parent date value: %s", date_str)
             else:
-                print("Parent date value is empty or null")
+                logger.info("Parent date value is empty or null")
         except:
-            print(f"Raw parent date value: {parent_value}")
+            logger.info("Raw parent date value: %s", parent_value)
         
         # If parent value is null or empty, try to create a date value based on what we see in the UI
         if not parent_value or parent_value == "null":
-            print("Parent date value is empty or null, trying to create a date value")
+            logger.info("Parent date value is empty or null, trying to create a date value")
             # Create a date value for March 11th (as seen in your screenshot)
             today = datetime.now()
             march_11 = datetime(today.year, 3, 11).strftime("%Y-%m-%d")
-            parent_value = json.dumps({"date": march_11})
-            print(f"Created date value: {march_11}")
+            parent_value = orjson.dumps({"date": march_11}).decode()
+            logger.info("Created date value: %s", march_11)
         
-        if parent_value:
+        if parent_value and not record_date_write(subitem_id, SUBITEM_DATE_COLUMN_ID, parent_value):
+            logger.info("Subitem %s already has this date, skipping update", subitem_id)
+        elif parent_value:
             try:
                 # Update the subitem with the parent's date value
-                print(f"Updating Date column in subitem {subitem_id}")
-                mutation = """
-                mutation UpdateSubitemDate($boardId: ID!, $itemId: ID!, $columnId: String!, $value: JSON!) {
-                    change_column_value(board_id: $boardId, item_id: $itemId, column_id: $columnId, value: $value) {
-                        id
-                    }
-                }
-                """
+                logger.info("Updating Date column in subitem %s", subitem_id)
                 
                 variables = {
                     "boardId": subitem_board_id,
                     "itemId": subitem_id,
-                    "columnId": subitem_date_col.get("id"),  # Use the subitem's date column ID
+                    "columnId": SUBITEM_DATE_COLUMN_ID,
                     "value": parent_value  # Use the value from parent
                 }
                 
-                result = await execute_monday_query(mutation, variables)
-                print(f"Update result: {json.dumps(result, indent=2)}")
+                result = await execute_monday_query(CHANGE_COLUMN_VALUE_MUTATION, variables)
+                logger.debug("Update result: %s", result)
             except Exception as e:
-                print(f"Error updating subitem date: {str(e)}")
+                forget_date_write(subitem_id, SUBITEM_DATE_COLUMN_ID, parent_value)
+                logger.error("Error updating subitem date: %s", e)
         else:
-            print("Parent date value is empty, nothing to sync")
+            logger.info("Parent date value is empty, nothing to sync")
     except Exception as e:
-        import traceback
-        print(f"Error syncing subitem with parent: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Error syncing subitem with parent: %s", e)
 
 @app.options("/webhook")
 async def webhook_options():
     """
     Handle OPTIONS requests for the webhook endpoint (CORS preflight)
     """
-    return JSONResponse(
+    return ORJSONResponse(
         content={"message": "OK"},
         headers={
             "Access-Control-Allow-Origin": "*",
@@ -479,7 +632,7 @@ async def root_options():
     """
     Handle OPTIONS requests for the root endpoint (CORS preflight)
     """
-    return JSONResponse(
+    return ORJSONResponse(
         content={"message": "OK"},
         headers={
             "Access-Control-Allow-Origin": "*",
@@ -491,4 +644,14 @@ async def root_options():
 # For local development
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True) 
+    # "auto" selects uvloop and httptools (installed by uvicorn[standard])
+    # and falls back to asyncio/h11 where they are unavailable, e.g. Windows
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="auto",
+        workers=int(os.getenv("WEB_CONCURRENCY", "2")),
+        reload=False
+    )
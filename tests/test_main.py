@@ -0,0 +1,131 @@
+import asyncio
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+os.environ.setdefault("MONDAY_API_KEY", "test-key")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answers every POST with an empty GraphQL result over a kept-alive connection"""
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = b'{"data": {}}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def monday_api(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(main, "MONDAY_API_URL", f"http://127.0.0.1:{server.server_address[1]}")
+    yield
+    server.shutdown()
+    server.server_close()
+
+
+def test_execute_monday_query_on_separate_event_loops(monday_api):
+    # Serverless runtimes may run each invocation on a fresh event loop
+    for _ in range(3):
+        loop = asyncio.new_event_loop()
+        try:
+            result = loop.run_until_complete(main.execute_monday_query("query { me { id } }"))
+        finally:
+            loop.close()
+        assert result == {"data": {}}
+
+
+def test_partial_batch_failure_only_forgets_failed_subitems(monkeypatch):
+    date_value = '{"date":"2024-03-11"}'
+    parent = {
+        "data": {
+            "items": [{
+                "name": "Parent",
+                "column_values": [{"value": date_value, "text": "2024-03-11"}],
+                "subitems": [
+                    {"id": "101", "name": "Written", "board": {"id": "9"}},
+                    {"id": "102", "name": "Failed", "board": {"id": "9"}},
+                ],
+            }]
+        }
+    }
+
+    async def fake_query(query, variables=None, allow_partial=False):
+        return parent
+
+    async def fake_batch(query, variables=None, allow_partial=False):
+        assert allow_partial
+        return {"data": {"s0": {"id": "101"}, "s1": None}}
+
+    monkeypatch.setattr(main, "execute_monday_query", fake_query)
+    monkeypatch.setattr(main, "execute_monday_query_limited", fake_batch)
+    main.RECENT_DATE_WRITES.clear()
+
+    asyncio.run(main.process_date_automation({"event": {"pulseId": "1"}}))
+
+    assert ("101", main.SUBITEM_DATE_COLUMN_ID) in main.RECENT_DATE_WRITES
+    assert ("102", main.SUBITEM_DATE_COLUMN_ID) not in main.RECENT_DATE_WRITES
+
+
+def test_webhook_answers_challenge_and_rejects_invalid_json():
+    from fastapi.testclient import TestClient
+
+    with TestClient(main.app) as client:
+        response = client.post("/webhook", json={"challenge": "abc"})
+        assert response.json() == {"challenge": "abc"}
+
+        response = client.post("/webhook", content=b"{not json")
+        assert response.status_code == 400
+
+
+def test_retry_backoff_releases_concurrency_semaphore(monkeypatch):
+    held_during_sleep = []
+    responses = iter([429, 200])
+
+    class FakeClient:
+        async def post(self, url, content):
+            status = next(responses)
+            return httpx.Response(status, content=b'{"data": {}}')
+
+    async def fake_sleep(delay):
+        held_during_sleep.append(main.monday_concurrency().locked())
+
+    monkeypatch.setattr(main, "MONDAY_CONCURRENCY_LIMIT", 1)
+    monkeypatch.setattr(main, "get_http_client", lambda: FakeClient())
+    monkeypatch.setattr(main.asyncio, "sleep", fake_sleep)
+
+    result = asyncio.run(main.execute_monday_query_limited("query { me { id } }"))
+
+    assert result == {"data": {}}
+    assert held_during_sleep == [False]
+
+
+def test_concurrency_semaphore_on_separate_event_loops(monkeypatch):
+    monkeypatch.setattr(main, "MONDAY_CONCURRENCY_LIMIT", 1)
+
+    async def contend():
+        async def hold():
+            async with main.monday_concurrency():
+                await asyncio.sleep(0.01)
+        await asyncio.gather(hold(), hold())
+
+    # A semaphore shared across loops raises once a second loop waits on it
+    for _ in range(2):
+        asyncio.run(contend())